@@ -204,7 +204,7 @@ app.post('/api/articles/save', async (req, res) => {
           return `      "Level 6 Instruction": "${articleData.level6Text && articleData.level6Text.length > 0 ? escapeJsString('Write a full-sentence answer for each question below.') : ''}",`;
         }
         if (line.includes('"Level 6 Writing Prompt"')) {
-          return `      "Level 6 Writing Prompt": "${articleData.level6WritingPrompt && articleData.level6WritingPrompt.trim().length > 0 ? `Free Writing\n${escapeJsString(articleData.level6WritingPrompt.trim())}` : ''}",`;
+          return `      "Level 6 Writing Prompt": "${articleData.level6WritingPrompt && articleData.level6WritingPrompt.trim().length > 0 ? escapeJsString(`Free Writing\n${articleData.level6WritingPrompt.trim()}`) : ''}",`;
         }
         return line;
       });
@@ -239,32 +239,40 @@ app.post('/api/articles/save', async (req, res) => {
       const newId = `rec${String(nextNumber).padStart(3, '0')}`;
 
 
+      const instructionText = 'Write a full-sentence answer for each question below.';
+      const writingPrompt = articleData.level6WritingPrompt ? articleData.level6WritingPrompt.trim() : '';
+
+      const fields = {
+        "Headline": articleData.headline || '',
+        "Slug": articleData.slug || '',
+        "Image URL": articleData.imageUrl || '',
+        "Level 0 Text": "",
+        "Level 0 Questions": "",
+        "Level 1 Text": articleData.level1Text || '',
+        "Level 1 Questions": articleData.level1Questions || '',
+        "Level 1 Instruction": articleData.level1Text ? instructionText : '',
+        "Level 2 Text": "",
+        "Level 2 Questions": "",
+        "Level 3 Text": articleData.level3Text || '',
+        "Level 3 Questions": articleData.level3Questions || '',
+        "Level 3 Instruction": articleData.level3Text ? instructionText : '',
+        "Level 4 Text": "",
+        "Level 4 Questions": "",
+        "Level 5 Text": "",
+        "Level 5 Questions": "",
+        "Level 6 Text": articleData.level6Text || '',
+        "Level 6 Questions": articleData.level6Questions || '',
+        "Level 6 Instruction": articleData.level6Text ? instructionText : '',
+        "Level 6 Writing Prompt": writingPrompt ? `Free Writing\n${writingPrompt}` : '',
+        "Date Written": articleData.dateWritten || ''
+      };
+
+      // Serialize all fields in one pass; JSON string escaping is valid JS
+      const fieldsCode = JSON.stringify(fields, null, 2).replace(/\n/g, '\n    ');
+
       const newArticle = `  {
     id: '${newId}',
-    fields: {
-      "Headline": "${escapeJsString(articleData.headline)}",
-      "Slug": "${articleData.slug}",
-      "Image URL": "${articleData.imageUrl}",
-      "Level 0 Text": "",
-      "Level 0 Questions": "",
-      "Level 1 Text": "${escapeJsString(articleData.level1Text)}",
-      "Level 1 Questions": "${escapeJsString(articleData.level1Questions)}",
-      "Level 1 Instruction": "${articleData.level1Text && articleData.level1Text.length > 0 ? escapeJsString('Write a full-sentence answer for each question below.') : ''}",
-      "Level 2 Text": "",
-      "Level 2 Questions": "",
-      "Level 3 Text": "${escapeJsString(articleData.level3Text)}",
-      "Level 3 Questions": "${escapeJsString(articleData.level3Questions)}",
-      "Level 3 Instruction": "${articleData.level3Text && articleData.level3Text.length > 0 ? escapeJsString('Write a full-sentence answer for each question below.') : ''}",
-      "Level 4 Text": "",
-      "Level 4 Questions": "",
-      "Level 5 Text": "",
-      "Level 5 Questions": "",
-      "Level 6 Text": "${escapeJsString(articleData.level6Text)}",
-      "Level 6 Questions": "${escapeJsString(articleData.level6Questions)}",
-      "Level 6 Instruction": "${articleData.level6Text && articleData.level6Text.length > 0 ? escapeJsString('Write a full-sentence answer for each question below.') : ''}",
-      "Level 6 Writing Prompt": "${articleData.level6WritingPrompt && articleData.level6WritingPrompt.trim().length > 0 ? `Free Writing\n${escapeJsString(articleData.level6WritingPrompt.trim())}` : ''}",
-      "Date Written": "${articleData.dateWritten}"
-    }
+    fields: ${fieldsCode}
   }`;
 
       // Add before the closing bracket of the array
@@ -42,35 +42,37 @@ export const writeArticleToFile = async (articleData, isNew = false) => {
 const generateArticleJSCode = (data, isNew) => {
   const id = data.id || `rec${String(newsData.length + 1).padStart(3, '0')}`;
 
-  // Escape quotes in string values
-  const escapeQuotes = (str) => str ? str.replace(/"/g, '\\"') : '';
+  const fields = {
+    "Headline": data.headline || '',
+    "Slug": data.slug || '',
+    "Image URL": data.imageUrl || '',
+    "Date Written": data.dateWritten || '',
+    "Level 0 Text": "",
+    "Level 0 Questions": "",
+    "Level 1 Text": data.level1Text || '',
+    "Level 1 Questions": data.level1Questions || '',
+    "Level 1 Instruction": data.level1Instruction || '',
+    "Level 2 Text": "",
+    "Level 2 Questions": "",
+    "Level 3 Text": data.level3Text || '',
+    "Level 3 Questions": data.level3Questions || '',
+    "Level 3 Instruction": data.level3Instruction || '',
+    "Level 4 Text": "",
+    "Level 4 Questions": "",
+    "Level 5 Text": "",
+    "Level 5 Questions": "",
+    "Level 6 Text": data.level6Text || '',
+    "Level 6 Questions": data.level6Questions || '',
+    "Level 6 Instruction": data.level6Instruction || '',
+    "Level 6 Writing Prompt": data.level6WritingPrompt || ''
+  };
+
+  // Serialize all fields at once; JSON escaping also covers newlines and backslashes
+  const fieldsCode = JSON.stringify(fields, null, 2).replace(/\n/g, '\n    ');
 
   return `  {
     id: '${id}',
-    fields: {
-      "Headline": "${escapeQuotes(data.headline)}",
-      "Slug": "${data.slug}",
-      "Image URL": "${data.imageUrl || ''}",
-      "Date Written": "${data.dateWritten}",
-      "Level 0 Text": "",
-      "Level 0 Questions": "",
-      "Level 1 Text": "${escapeQuotes(data.level1Text)}",
-      "Level 1 Questions": "${escapeQuotes(data.level1Questions)}",
-      "Level 1 Instruction": "${escapeQuotes(data.level1Instruction)}",
-      "Level 2 Text": "",
-      "Level 2 Questions": "",
-      "Level 3 Text": "${escapeQuotes(data.level3Text)}",
-      "Level 3 Questions": "${escapeQuotes(data.level3Questions)}",
-      "Level 3 Instruction": "${escapeQuotes(data.level3Instruction)}",
-      "Level 4 Text": "",
-      "Level 4 Questions": "",
-      "Level 5 Text": "",
-      "Level 5 Questions": "",
-      "Level 6 Text": "${escapeQuotes(data.level6Text)}",
-      "Level 6 Questions": "${escapeQuotes(data.level6Questions)}",
-      "Level 6 Instruction": "${escapeQuotes(data.level6Instruction)}",
-      "Level 6 Writing Prompt": "${escapeQuotes(data.level6WritingPrompt)}"
-    }
+    fields: ${fieldsCode}
   }`;
 };
 
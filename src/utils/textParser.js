@@ -1,6 +1,26 @@
 // src/utils/textParser.js
 // Dedicated utility for parsing news article text content
 
+// Marker patterns in priority order: the first pattern that matches anywhere wins,
+// even if a lower-priority marker appears earlier in the text. Keep one pattern per
+// marker rather than merging them into an alternation, which would pick the leftmost match.
+const INSTRUCTION_MARKER_PATTERNS = [/Write a full sentence/i, /Write a full-sentence/i, /Answer each question/i, /Write full sentences/i, /In your Vocab Notebook/i];
+const WRITING_PROMPT_MARKER_PATTERNS = [/Free Writing/i, /Academic Writing/i, /Writing Practice/i];
+
+/**
+ * Finds the position of the first marker (in list order) that appears in the text
+ * @param {string} text - The text to search
+ * @param {RegExp[]} patterns - Case-insensitive marker patterns, highest priority first
+ * @returns {number} Index of the matched marker, or -1 if none is present
+ */
+const findMarkerIndex = (text, patterns) => {
+  for (const pattern of patterns) {
+    const index = text.search(pattern);
+    if (index !== -1) return index;
+  }
+  return -1;
+};
+
 /**
  * Parses article content and separates homework sections
  * @param {string} fullText - The complete article text including homework
@@ -36,16 +56,7 @@ export const parseLevelContent = (fullText, level) => {
  */
 const parseLevel6Content = (articleText, afterHomework) => {
   // Look for actual writing prompt sections
-  const writingPromptMarkers = ['Free Writing', 'Academic Writing', 'Writing Practice', 'writing practice'];
-  let writingIndex = -1;
-
-  for (const marker of writingPromptMarkers) {
-    const index = afterHomework.toLowerCase().indexOf(marker.toLowerCase());
-    if (index !== -1) {
-      writingIndex = index;
-      break;
-    }
-  }
+  const writingIndex = findMarkerIndex(afterHomework, WRITING_PROMPT_MARKER_PATTERNS);
 
   if (writingIndex !== -1) {
     // Split at the writing prompt section
@@ -77,131 +88,21 @@ const parseLevel1And3Content = (articleText, afterHomework) => {
  * Extracts instruction and questions from homework content
  */
 const extractInstructionAndQuestions = (homeworkContent) => {
-  const instructionMarkers = ['Write a full sentence', 'Write a full-sentence', 'Answer each question', 'Write full sentences', 'In your Vocab Notebook'];
-  let instruction = '';
-  let questions = homeworkContent;
-
-  for (const marker of instructionMarkers) {
-    const index = homeworkContent.toLowerCase().indexOf(marker.toLowerCase());
-    if (index !== -1) {
-      const parts = homeworkContent.split('\n');
-      let instructionFound = false;
-
-      for (let i = 0; i < parts.length; i++) {
-        if (parts[i].toLowerCase().includes(marker.toLowerCase())) {
-          instruction = parts[i].trim();
-          questions = parts.slice(i + 1).join('\n').trim();
-          instructionFound = true;
-          break;
-        }
-      }
-
-      if (instructionFound) break;
-    }
+  const markerIndex = findMarkerIndex(homeworkContent, INSTRUCTION_MARKER_PATTERNS);
+  if (markerIndex === -1) {
+    return { instruction: '', questions: homeworkContent };
   }
 
-  return { instruction, questions };
-};
+  // The instruction is the whole line containing the marker; questions follow it
+  const lineStart = homeworkContent.lastIndexOf('\n', markerIndex) + 1;
+  const lineEnd = homeworkContent.indexOf('\n', markerIndex);
 
-/**
- * Converts raw article data to canonical schema format
- * @param {object} articleData - Raw article data from newsData.js
- * @param {number} level - The difficulty level
- * @returns {object} Article in canonical schema format
- */
-export const transformArticleToCanonicalSchema = (articleData, level) => {
-  const contentBlocks = [];
-
-  // Get the already-parsed content from the data structure
-  const articleText = articleData.fields[`Level ${level} Text`];
-  const questions = articleData.fields[`Level ${level} Questions`];
-  const instruction = articleData.fields[`Level ${level} Instruction`];
-  const writingPrompt = articleData.fields[`Level ${level} Writing Prompt`];
-
-  // Add article text block
-  if (articleText) {
-    contentBlocks.push({
-      blockId: `${articleData.fields.Slug}-article-text`,
-      type: 'text',
-      data: {
-        htmlContent: articleText
-      },
-      accessibility: {
-        ariaLabel: `Level ${level} article text`
-      }
-    });
+  if (lineEnd === -1) {
+    return { instruction: homeworkContent.substring(lineStart).trim(), questions: '' };
   }
 
-  // Add comprehension questions block as formatted text
-  if (questions) {
-    // Format questions as an ordered list
-    const formattedQuestions = questions.split('\n')
-      .filter(line => line.trim())
-      .map(line => `<li>${line.trim()}</li>`)
-      .join('');
-
-    // Include instruction if present
-    const instructionHtml = instruction ?
-      `<p style="margin-bottom: 1em; font-weight: bold; text-align: center; color: inherit;">${instruction}</p>` : '';
-
-    const questionsHtml = `
-      <h4 style="font-weight: bold; margin-bottom: 1em; color: inherit; text-align: center;">Comprehension Questions:</h4>
-      ${instructionHtml}
-      <ol style="list-style-position: inside; padding-left: 0; margin: 0; display: grid; gap: 1em;">
-        ${formattedQuestions}
-      </ol>
-    `;
-
-    contentBlocks.push({
-      blockId: `${articleData.fields.Slug}-comprehension-questions`,
-      type: 'text',
-      data: {
-        htmlContent: questionsHtml
-      },
-      accessibility: {
-        ariaLabel: `Comprehension questions for level ${level}`
-      }
-    });
-  }
+  const instruction = homeworkContent.substring(lineStart, lineEnd).trim();
+  const questions = homeworkContent.substring(lineEnd + 1).trim();
 
-  // Add writing prompt block for level 6
-  if (writingPrompt && level === 6) {
-    // Remove "Free Writing" from the beginning of the prompt if it exists
-    const cleanWritingPrompt = writingPrompt.replace(/^Free Writing[\s\n]*/, '').trim();
-
-    const writingPromptHtml = `
-      <h4 style="font-weight: bold; margin-bottom: 1em; color: inherit; text-align: center;">Free Writing</h4>
-      <p style="margin: 0; text-align: center;">${cleanWritingPrompt}</p>
-    `;
-
-    contentBlocks.push({
-      blockId: `${articleData.fields.Slug}-writing-prompt`,
-      type: 'text',
-      data: {
-        htmlContent: writingPromptHtml
-      },
-      accessibility: {
-        ariaLabel: `Writing prompt for level ${level}`
-      }
-    });
-  }
-
-  return {
-    lessonId: `${articleData.fields.Slug}-level-${level}`,
-    title: articleData.fields.Headline,
-    subtitle: `Level ${level} News Article`,
-    content: contentBlocks
-  };
-};
-
-/**
- * Transforms all articles for a specific level to canonical schema format
- * @param {array} articlesData - Array of article data from newsData.js
- * @param {number} level - The difficulty level
- * @returns {array} Array of articles in canonical schema format
- */
-export const transformAllArticlesForLevel = (articlesData, level) => {
-  return articlesData
-    .filter(article => article.fields[`Level ${level} Text`])
-    .map(article => transformArticleToCanonicalSchema(article, level));
+  return { instruction, questions };
 };